@@ -19,10 +19,19 @@ get_current_user = _get_current_user
 _seed_cache: dict[str, Any] | None = None
 
 
+def _normalise_provenance(data: dict[str, Any]) -> dict[str, Any]:
+    """Guarantee every seeded record has a ``source`` so routes can index it directly."""
+    for records in data.values():
+        if isinstance(records, list):
+            for rec in records:
+                rec.setdefault("source", "synthetic_seeded")
+    return data
+
+
 def get_seed_data() -> dict[str, Any]:
     """Return the deterministic seed data, cached on first call."""
     global _seed_cache
     if _seed_cache is None:
         gen = SeedGenerator(seed=settings.SEED)
-        _seed_cache = gen.generate_all()
+        _seed_cache = _normalise_provenance(gen.generate_all())
     return _seed_cache
@@ -33,6 +33,9 @@ from app.schemas.modules import (
 
 router = APIRouter(prefix="/api/deploy", tags=["deploy"])
 
+_INSTALLING_STATUSES = frozenset(("installing", "commissioning"))
+_PENDING_STATUSES = frozenset(("planned", "site_prep"))
+
 # ── In-memory stores ─────────────────────────────────────────────────────────
 
 _deliveries_store: list[dict[str, Any]] | None = None
@@ -125,7 +128,7 @@ async def list_deploy(
                 status=j["status"],
                 commissioning_date=j.get("commissioning_date"),
                 crew_lead=j.get("crew_lead"),
-                source=j.get("source", "synthetic_seeded"),
+                source=j["source"],
                 source_id=j.get("source_id"),
             )
             for j in dlv_jobs
@@ -140,7 +143,7 @@ async def list_deploy(
                 estimated_arrival=dlv.get("estimated_arrival"),
                 actual_arrival=dlv.get("actual_arrival"),
                 deployment_jobs=job_summaries,
-                source=dlv.get("source", "synthetic_seeded"),
+                source=dlv["source"],
                 source_id=dlv.get("source_id"),
             )
         )
@@ -311,7 +314,7 @@ async def get_deployment_job(
                 commissioning_date=job.get("commissioning_date"),
                 crew_lead=job.get("crew_lead"),
                 checklist=checklist,
-                source=job.get("source", "synthetic_seeded"),
+                source=job["source"],
                 source_id=job.get("source_id"),
             )
 
@@ -350,7 +353,7 @@ async def update_checklist(
                 commissioning_date=job.get("commissioning_date"),
                 crew_lead=job.get("crew_lead"),
                 checklist=checklist,
-                source=job.get("source", "synthetic_seeded"),
+                source=job["source"],
                 source_id=job.get("source_id"),
             )
 
@@ -369,8 +372,8 @@ async def commissioning_overview(
 
     total = len(jobs)
     completed = sum(1 for j in jobs if j["status"] == "completed")
-    in_progress = sum(1 for j in jobs if j["status"] in ("installing", "commissioning"))
-    pending = sum(1 for j in jobs if j["status"] in ("planned", "site_prep"))
+    in_progress = sum(1 for j in jobs if j["status"] in _INSTALLING_STATUSES)
+    pending = sum(1 for j in jobs if j["status"] in _PENDING_STATUSES)
     issues = sum(1 for j in jobs if j["status"] == "on_hold")
 
     return CommissioningOverview(
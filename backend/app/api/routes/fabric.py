@@ -8,16 +8,15 @@ from fastapi import APIRouter, Depends
 
 from app.api.deps import get_current_user, get_seed_data
 from app.schemas.modules import (
-    CameraDefaults,
     FabricItem,
     FabricListResponse,
-    SceneObject,
     SceneResponse,
-    Vec3,
 )
 
 router = APIRouter(prefix="/api/fabric", tags=["fabric"])
 
+_ACTIVE_STATUSES = frozenset(("in_progress", "scheduled"))
+
 
 @router.get("", response_model=FabricListResponse)
 async def list_fabric(
@@ -31,10 +30,17 @@ async def list_fabric(
     lines = data["production_lines"]
     work_orders = data["work_orders"]
 
+    # Count work orders per line in one pass instead of rescanning them for every line
+    total_by_line: dict[str | None, int] = {}
+    active_by_line: dict[str | None, int] = {}
+    for wo in work_orders:
+        line_id = wo.get("production_line_id")
+        total_by_line[line_id] = total_by_line.get(line_id, 0) + 1
+        if wo["status"] in _ACTIVE_STATUSES:
+            active_by_line[line_id] = active_by_line.get(line_id, 0) + 1
+
     fabric_items: list[FabricItem] = []
     for pl in lines:
-        wo_for_line = [wo for wo in work_orders if wo.get("production_line_id") == pl["id"]]
-        active = sum(1 for wo in wo_for_line if wo["status"] in ("in_progress", "scheduled"))
         fabric_items.append(
             FabricItem(
                 id=pl["id"],
@@ -43,9 +49,9 @@ async def list_fabric(
                 capacity_units_per_day=pl["capacity_units_per_day"],
                 status=pl["status"],
                 current_workorder_id=pl.get("current_workorder_id"),
-                active_work_orders=active,
-                total_work_orders=len(wo_for_line),
-                source=pl.get("source", "synthetic_seeded"),
+                active_work_orders=active_by_line.get(pl["id"], 0),
+                total_work_orders=total_by_line.get(pl["id"], 0),
+                source=pl["source"],
                 source_id=pl.get("source_id"),
             )
         )
@@ -65,26 +71,6 @@ async def get_factory_scene(
     current_user: dict[str, Any] = Depends(get_current_user),
 ) -> SceneResponse:
     """Return 3D scene objects for the factory layout visualisation."""
-    data = get_seed_data()
-    scene = data["factory_scene"]
-
-    objects = [
-        SceneObject(
-            id=obj["id"],
-            name=obj["name"],
-            type=obj["type"],
-            position=Vec3(**obj["position"]),
-            rotation=Vec3(**obj["rotation"]),
-            scale=Vec3(**obj["scale"]),
-            color=obj["color"],
-            metadata=obj.get("metadata"),
-        )
-        for obj in scene["objects"]
-    ]
-    cam = scene["camera"]
-    camera = CameraDefaults(
-        position=Vec3(**cam["position"]),
-        target=Vec3(**cam["target"]),
-        fov=cam.get("fov", 60.0),
-    )
-    return SceneResponse(objects=objects, camera=camera)
+    # The seed scene already has the response shape (x/y/z dicts included), so
+    # validate it in one pass instead of rebuilding every Vec3 by hand.
+    return SceneResponse.model_validate(get_seed_data()["factory_scene"])
@@ -65,7 +65,7 @@ def _build_bom_detail(bom_raw: dict, house_configs: list[dict]) -> BOMDetail:
         items=bom_items,
         total_cost=bom_raw.get("total_cost", 0.0),
         status=bom_raw.get("status", "draft"),
-        source=bom_raw.get("source", "synthetic_seeded"),
+        source=bom_raw["source"],
         source_id=bom_raw.get("source_id"),
     )
 
@@ -83,7 +83,7 @@ def _build_qa_detail(qa_raw: dict) -> QARecordDetail:
         defects=defects,
         notes=qa_raw.get("notes"),
         inspected_at=qa_raw.get("inspected_at"),
-        source=qa_raw.get("source", "synthetic_seeded"),
+        source=qa_raw["source"],
         source_id=qa_raw.get("source_id"),
     )
 
@@ -153,7 +153,7 @@ def _build_work_order_detail(
         bom=bom_detail,
         qa_records=qa_details,
         status_history=status_history,
-        source=wo_raw.get("source", "synthetic_seeded"),
+        source=wo_raw["source"],
         source_id=wo_raw.get("source_id"),
     )
 
@@ -327,7 +327,7 @@ async def list_inventory(
                 min_stock=inv["min_stock"],
                 max_stock=inv["max_stock"],
                 reorder_needed=reorder,
-                source=inv.get("source", "synthetic_seeded"),
+                source=inv["source"],
                 source_id=inv.get("source_id"),
             )
         )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -26,19 +25,47 @@ router = APIRouter(prefix="/api/frameworks", tags=["frameworks"])
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
 
+def _material_summary(m: dict[str, Any]) -> MaterialSummary:
+    """Build a MaterialSummary from a raw seed material."""
+    return MaterialSummary(
+        id=m["id"],
+        name=m["name"],
+        category=m["category"],
+        grade=m["grade"],
+        is_smart_material=m["is_smart_material"],
+        tensile_strength=m["tensile_strength"],
+        embodied_carbon_kg=m["embodied_carbon_kg"],
+        source=m["source"],
+        source_id=m.get("source_id"),
+    )
+
+
+def _patent_summary(p: dict[str, Any]) -> PatentSummary:
+    """Build a PatentSummary from a raw seed patent."""
+    return PatentSummary(
+        id=p["id"],
+        title=p["title"],
+        filing_number=p["filing_number"],
+        status=p["status"],
+        filing_date=p.get("filing_date"),
+        source=p["source"],
+        source_id=p.get("source_id"),
+    )
+
+
 def _build_framework_item(
     fw: dict[str, Any],
     idx: int,
-    material_summaries: list[MaterialSummary],
-    patent_summaries: list[PatentSummary],
+    materials_raw: list[dict[str, Any]],
+    patents_raw: list[dict[str, Any]],
 ) -> FrameworkItem:
-    """Build a FrameworkItem from raw seed data with related materials/patents."""
-    json.loads(fw.get("materials_json", "[]")) if fw.get("materials_json") else []
-    json.loads(fw.get("patent_ids", "[]")) if fw.get("patent_ids") else []
+    """Build a FrameworkItem from raw seed data with related materials/patents.
 
+    Only the summaries this framework references are built.
+    """
     # Assign a subset of materials and patents to each framework
-    fw_materials = material_summaries[idx * 3 : idx * 3 + 3]
-    fw_patents = patent_summaries[idx : idx + 2]
+    fw_materials = [_material_summary(m) for m in materials_raw[idx * 3 : idx * 3 + 3]]
+    fw_patents = [_patent_summary(p) for p in patents_raw[idx : idx + 2]]
 
     return FrameworkItem(
         id=fw["id"],
@@ -48,53 +75,11 @@ def _build_framework_item(
         structural_rating=fw["structural_rating"],
         materials=fw_materials,
         patents=fw_patents,
-        source=fw.get("source", "synthetic_seeded"),
+        source=fw["source"],
         source_id=fw.get("source_id"),
     )
 
 
-def _build_summaries() -> tuple[
-    list[dict[str, Any]],
-    list[MaterialSummary],
-    list[PatentSummary],
-]:
-    """Build material and patent summaries from seed data."""
-    data = get_seed_data()
-    frameworks_raw = data["frameworks"]
-    materials_raw = data["materials"]
-    patents_raw = data["patents"]
-
-    material_summaries = [
-        MaterialSummary(
-            id=m["id"],
-            name=m["name"],
-            category=m["category"],
-            grade=m["grade"],
-            is_smart_material=m["is_smart_material"],
-            tensile_strength=m["tensile_strength"],
-            embodied_carbon_kg=m["embodied_carbon_kg"],
-            source=m.get("source", "synthetic_seeded"),
-            source_id=m.get("source_id"),
-        )
-        for m in materials_raw
-    ]
-
-    patent_summaries = [
-        PatentSummary(
-            id=p["id"],
-            title=p["title"],
-            filing_number=p["filing_number"],
-            status=p["status"],
-            filing_date=p.get("filing_date"),
-            source=p.get("source", "synthetic_seeded"),
-            source_id=p.get("source_id"),
-        )
-        for p in patents_raw
-    ]
-
-    return frameworks_raw, material_summaries, patent_summaries
-
-
 # ── GET: list frameworks ───────────────────────────────────────────────────
 
 
@@ -106,14 +91,13 @@ async def list_frameworks(
 
     Falls back to seed data when the database is empty or unavailable.
     """
-    frameworks_raw, material_summaries, patent_summaries = _build_summaries()
     data = get_seed_data()
+    materials_raw = data["materials"]
+    patents_raw = data["patents"]
 
     framework_items: list[FrameworkItem] = []
-    for idx, fw in enumerate(frameworks_raw):
-        framework_items.append(
-            _build_framework_item(fw, idx, material_summaries, patent_summaries)
-        )
+    for idx, fw in enumerate(data["frameworks"]):
+        framework_items.append(_build_framework_item(fw, idx, materials_raw, patents_raw))
 
     return FrameworkListResponse(
         frameworks=framework_items,
@@ -132,11 +116,11 @@ async def get_framework(
     current_user: dict[str, Any] = Depends(get_current_user),
 ) -> FrameworkItem:
     """Get a single framework with its materials list and patent references."""
-    frameworks_raw, material_summaries, patent_summaries = _build_summaries()
+    data = get_seed_data()
 
-    for idx, fw in enumerate(frameworks_raw):
+    for idx, fw in enumerate(data["frameworks"]):
         if fw["id"] == framework_id:
-            return _build_framework_item(fw, idx, material_summaries, patent_summaries)
+            return _build_framework_item(fw, idx, data["materials"], data["patents"])
 
     raise HTTPException(status_code=404, detail=f"Framework {framework_id} not found")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import Any
 
@@ -13,6 +14,17 @@ from app.schemas.modules import IntelligenceInsight, IntelligenceListResponse
 router = APIRouter(prefix="/api/intelligence", tags=["intelligence"])
 
 
+@functools.cache
+def _parse_json(raw: str) -> Any:
+    """Decode a seed ``*_json`` string once; seed strings never change, so reuse the result.
+
+    Callers share the cached object: pydantic copies it only shallowly, so
+    nested dicts and lists end up inside response models as-is.  Never
+    mutate the returned value.
+    """
+    return json.loads(raw)
+
+
 @router.get("", response_model=IntelligenceListResponse)
 async def list_intelligence(
     current_user: dict[str, Any] = Depends(get_current_user),
@@ -34,10 +46,10 @@ async def list_intelligence(
                 title=rpt["title"],
                 module=rpt["module"],
                 report_type=rpt["report_type"],
-                parameters=json.loads(params) if isinstance(params, str) else params,
-                results=json.loads(results) if isinstance(results, str) else results,
+                parameters=_parse_json(params) if isinstance(params, str) else params,
+                results=_parse_json(results) if isinstance(results, str) else results,
                 generated_at=rpt.get("generated_at"),
-                source=rpt.get("source", "synthetic_seeded"),
+                source=rpt["source"],
                 source_id=rpt.get("source_id"),
             )
         )
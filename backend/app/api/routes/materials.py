@@ -5,6 +5,7 @@ Explicitly excludes LSF and weak materials from all results.
 
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -39,11 +40,16 @@ _EXCLUDED_TERMS = frozenset(
 )
 
 
+# All terms in one case-insensitive alternation: one scan per field instead of one per term
+_EXCLUDED_RE = re.compile("|".join(map(re.escape, sorted(_EXCLUDED_TERMS))), re.IGNORECASE)
+
+
 def _is_excluded(material: dict[str, Any]) -> bool:
     """Check if a material should be excluded (LSF or weak)."""
-    name_lower = material.get("name", "").lower()
-    cat_lower = material.get("category", "").lower()
-    return any(term in name_lower or term in cat_lower for term in _EXCLUDED_TERMS)
+    return bool(
+        _EXCLUDED_RE.search(material.get("name", ""))
+        or _EXCLUDED_RE.search(material.get("category", ""))
+    )
 
 
 def _build_material_detail(
@@ -71,7 +77,7 @@ def _build_material_detail(
         compliance_certs=mat.get("compliance_certs", ""),
         lead_time_days=lead_time,
         cost_per_kg=cost_per_kg,
-        source=mat.get("source", "synthetic_seeded"),
+        source=mat["source"],
         source_id=mat.get("source_id"),
     )
 
@@ -205,10 +211,14 @@ async def compare_materials(
 
 @router.get("/audit-trail", response_model=MaterialAuditTrailResponse)
 async def get_audit_trail(
+    material_id: str | None = None,
     current_user: dict[str, Any] = Depends(get_current_user),
 ) -> MaterialAuditTrailResponse:
-    """Get the material selection audit trail."""
-    entries = [MaterialAuditTrail(**e) for e in _audit_trail]
+    """Get the material selection audit trail, optionally for a single material."""
+    records = _audit_trail
+    if material_id:
+        records = [e for e in records if e["material_id"] == material_id]
+    entries = [MaterialAuditTrail(**e) for e in records]
     return MaterialAuditTrailResponse(entries=entries, total=len(entries))
 
 
@@ -104,7 +104,7 @@ def _build_partner_detail(
         capacity_plans=cap_months,
         compliance_docs=compliance_docs,
         quotes=partner_quotes,
-        source=p.get("source", "synthetic_seeded"),
+        source=p["source"],
         source_id=p.get("source_id"),
     )
 
@@ -146,10 +146,12 @@ async def list_partners(
     partners_raw = data["partners"]
     plans_raw = data["capacity_plans"]
 
-    # Index capacity plans by partner_id
+    # Index capacity plans by partner_id, summing utilisation on the way
     plans_by_partner: dict[str, list[dict[str, Any]]] = {}
+    util_sum = 0.0
     for plan in plans_raw:
         plans_by_partner.setdefault(plan["partner_id"], []).append(plan)
+        util_sum += plan["utilization_pct"]
 
     partner_items: list[PartnerItem] = []
     for p in partners_raw:
@@ -161,7 +163,7 @@ async def list_partners(
                 allocated_units=cp["allocated_units"],
                 available_units=cp["available_units"],
                 utilization_pct=cp["utilization_pct"],
-                source=cp.get("source", "synthetic_seeded"),
+                source=cp["source"],
                 source_id=cp.get("source_id"),
             )
             for cp in p_plans
@@ -177,14 +179,13 @@ async def list_partners(
                 rating=p["rating"],
                 lead_time_days=p["lead_time_days"],
                 capacity_plans=plan_summaries,
-                source=p.get("source", "synthetic_seeded"),
+                source=p["source"],
                 source_id=p.get("source_id"),
             )
         )
 
     total_cap = sum(p.capacity_units_per_month for p in partner_items)
-    all_util = [cp["utilization_pct"] for cp in plans_raw]
-    avg_util = round(sum(all_util) / len(all_util), 1) if all_util else 0.0
+    avg_util = round(util_sum / len(plans_raw), 1) if plans_raw else 0.0
 
     return PartnerListResponse(
         partners=partner_items,
@@ -46,7 +46,7 @@ def _build_patent_detail(p: dict[str, Any]) -> PatentDetail:
         inventors=p.get("inventors", ""),
         novelty_notes=p.get("novelty_notes", ""),
         additional_experiments=additional_parsed,
-        source=p.get("source", "synthetic_seeded"),
+        source=p["source"],
         source_id=p.get("source_id"),
     )
 
@@ -27,6 +27,8 @@ from app.schemas.sales import (
 
 router = APIRouter(prefix="/api/sales", tags=["sales"])
 
+_QUALIFIED_STATUSES = frozenset(("qualified", "proposal", "negotiation", "won"))
+
 # ── In-memory store for dynamic lead mutations ────────────────────────────────
 
 _leads_store: list[dict[str, Any]] | None = None
@@ -42,6 +44,17 @@ def _get_leads_store() -> list[dict[str, Any]]:
     return _leads_store
 
 
+def _pipeline_totals(opps: list[dict[str, Any]]) -> tuple[float, float]:
+    """Return ``(total_value, weighted_value)`` for opportunities in a single pass."""
+    total_value = 0.0
+    weighted_value = 0.0
+    for o in opps:
+        value = o["value"]
+        total_value += value
+        weighted_value += value * o["probability"]
+    return total_value, weighted_value
+
+
 # ── Existing endpoint (unchanged contract) ────────────────────────────────────
 
 
@@ -72,7 +85,7 @@ async def list_sales(
                 value=o["value"],
                 stage=o["stage"],
                 probability=o["probability"],
-                source=o.get("source", "synthetic_seeded"),
+                source=o["source"],
                 source_id=o.get("source_id"),
             )
             for o in lead_opps
@@ -86,17 +99,14 @@ async def list_sales(
                 status=ld["status"],
                 score=ld["score"],
                 opportunities=opp_summaries,
-                source=ld.get("source", "synthetic_seeded"),
+                source=ld["source"],
                 source_id=ld.get("source_id"),
             )
         )
 
     # Pipeline stats
-    total_value = sum(o["value"] for o in opps_raw)
-    weighted_value = sum(o["value"] * o["probability"] for o in opps_raw)
-    qualified = sum(
-        1 for ld in leads_raw if ld["status"] in ("qualified", "proposal", "negotiation", "won")
-    )
+    total_value, weighted_value = _pipeline_totals(opps_raw)
+    qualified = sum(1 for ld in leads_raw if ld["status"] in _QUALIFIED_STATUSES)
     avg_deal = total_value / len(opps_raw) if opps_raw else 0.0
 
     pipeline = PipelineStats(
@@ -195,12 +205,6 @@ async def pipeline_stats(
             stage_counts[mapped] += 1
             stage_values[mapped] += opp["value"]
 
-    # Also count leads by status for stages without opportunities
-    for ld in leads_raw:
-        if ld["status"] in ("won", "lost") and ld["status"] in stage_counts:
-            # Already counted via opportunities where applicable
-            pass
-
     total_opps = sum(stage_counts.values())
     stages: list[PipelineStage] = []
     for sname in stage_names:
@@ -256,8 +260,7 @@ async def pipeline_stats(
         )
 
     # ── Summary metrics ──────────────────────────────────────────────
-    total_value = sum(o["value"] for o in opps_raw)
-    weighted_value = sum(o["value"] * o["probability"] for o in opps_raw)
+    total_value, weighted_value = _pipeline_totals(opps_raw)
     avg_deal = total_value / len(opps_raw) if opps_raw else 0.0
     won_count = stage_counts.get("won", 0)
     win_rate = (won_count / total_opps * 100) if total_opps > 0 else 0.0
@@ -30,6 +30,9 @@ class Settings(BaseSettings):
         "http://localhost:5173",
         "http://localhost:8000",
     ]
+    # Responses smaller than GZIP_MINIMUM_SIZE bytes are sent uncompressed
+    GZIP_MINIMUM_SIZE: int = 1000
+    GZIP_COMPRESS_LEVEL: int = 6
 
     # ── Observability ─────────────────────────────────────────────────
     LOG_LEVEL: str = "INFO"
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 import structlog
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import (
     auth,
@@ -86,6 +87,13 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # ── Compression ───────────────────────────────────────────────────
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    )
+
     # ── Security headers middleware ───────────────────────────────────
     @app.middleware("http")
     async def security_headers(request: Request, call_next: Any) -> Response:
@@ -14,6 +14,20 @@ from typing import Any
 
 from faker import Faker
 
+# Small fixed pools for ``random.choice``; repeats weight the draw (e.g. 3:1 "running")
+_QUARTER_HOURS = (0, 15, 30, 45)
+_BOOLS = (True, False)
+_SUPPLIER_LEAD_TIMES = (7, 10, 14, 21, 28)
+_PARTNER_LEAD_TIMES = (21, 30, 45, 60)
+_HOME_MODELS = ("T1", "T3", "T4+", "Studio", "Duplex")
+_BOM_STATUSES = ("draft", "approved", "in_production")
+_LINE_STATUSES = ("idle", "running", "running", "running")
+_QA_RESULTS = ("pass", "pass", "pass", "minor_defect")
+_DELIVERY_STATUSES = ("preparing", "in_transit", "delivered")
+_DEPLOYMENT_STATUSES = ("planned", "site_prep", "installing", "commissioning", "completed")
+_QUOTE_STATUSES = ("active", "active", "expired")
+_TRENDS = ("up", "stable", "down")
+
 
 class SeedGenerator:
     """Generates realistic, deterministic domain data for all modules.
@@ -31,6 +45,9 @@ class SeedGenerator:
         Faker.seed(seed)
         self._rng = random.Random(seed)
         self._uuid_ns = uuid.UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
+        # "Now" is pinned for determinism, so its ISO form is computed once
+        self._now_iso = self._utcnow().isoformat()
+        self._source_id = f"seed-{seed}"
 
     # ── helpers ───────────────────────────────────────────────────────────────
 
@@ -53,17 +70,16 @@ class SeedGenerator:
             d.month,
             d.day,
             self._rng.randint(6, 20),
-            self._rng.choice([0, 15, 30, 45]),
+            self._rng.choice(_QUARTER_HOURS),
             tzinfo=UTC,
         )
 
     def _provenance(self) -> dict[str, Any]:
-        now = self._utcnow()
         return {
             "source": "synthetic_seeded",
-            "source_id": f"seed-{self.seed}",
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
+            "source_id": self._source_id,
+            "created_at": self._now_iso,
+            "updated_at": self._now_iso,
         }
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -90,7 +106,7 @@ class SeedGenerator:
                     "name": name,
                     "country": country,
                     "rating": round(self._rng.uniform(4.0, 5.0), 1),
-                    "lead_time_days": self._rng.choice([7, 10, 14, 21, 28]),
+                    "lead_time_days": self._rng.choice(_SUPPLIER_LEAD_TIMES),
                     "certifications": certs,
                     "contact_email": f"sales@{name.lower().replace(' ', '').replace('.', '')[:12]}.eu",
                     **self._provenance(),
@@ -433,7 +449,7 @@ class SeedGenerator:
                         {
                             "tests_conducted": self._rng.randint(5, 20),
                             "success_rate_pct": round(self._rng.uniform(88, 99.5), 1),
-                            "peer_reviewed": self._rng.choice([True, False]),
+                            "peer_reviewed": self._rng.choice(_BOOLS),
                         }
                     ),
                     "inventors": "Dr. Maria Santos, Eng. Pedro Almeida, Dr. Sofia Costa",
@@ -484,7 +500,7 @@ class SeedGenerator:
                     "assigned_to": self.fake.name(),
                     "region": region,
                     "pipeline_value": value,
-                    "notes": f"Interested in Planta Smart Homes {self._rng.choice(['T1', 'T3', 'T4+', 'Studio', 'Duplex'])} model.",
+                    "notes": f"Interested in Planta Smart Homes {self._rng.choice(_HOME_MODELS)} model.",
                     **self._provenance(),
                 }
             )
@@ -578,7 +594,7 @@ class SeedGenerator:
                     "version": 1,
                     "items_json": json.dumps(bom_items),
                     "total_cost": round(total, 2),
-                    "status": self._rng.choice(["draft", "approved", "in_production"]),
+                    "status": self._rng.choice(_BOM_STATUSES),
                     **self._provenance(),
                 }
             )
@@ -604,7 +620,7 @@ class SeedGenerator:
                     "name": name,
                     "location": loc,
                     "capacity_units_per_day": cap,
-                    "status": self._rng.choice(["idle", "running", "running", "running"]),
+                    "status": self._rng.choice(_LINE_STATUSES),
                     "current_workorder_id": None,
                     **self._provenance(),
                 }
@@ -690,7 +706,7 @@ class SeedGenerator:
                         "id": self._deterministic_uuid("qa_record", i),
                         "work_order_id": wo["id"],
                         "inspector": inspectors[i % len(inspectors)],
-                        "result": self._rng.choice(["pass", "pass", "pass", "minor_defect"]),
+                        "result": self._rng.choice(_QA_RESULTS),
                         "defects_json": json.dumps([])
                         if self._rng.random() > 0.2
                         else json.dumps(
@@ -735,7 +751,7 @@ class SeedGenerator:
                         "origin": "Figueira da Foz, Portugal",
                         "destination": destinations_pt[idx % len(destinations_pt)],
                         "carrier": carriers[idx % len(carriers)],
-                        "status": self._rng.choice(["preparing", "in_transit", "delivered"]),
+                        "status": self._rng.choice(_DELIVERY_STATUSES),
                         "estimated_arrival": est.isoformat(),
                         "actual_arrival": est.isoformat() if self._rng.random() > 0.4 else None,
                         **self._provenance(),
@@ -762,16 +778,14 @@ class SeedGenerator:
                     "id": self._deterministic_uuid("deployment", i),
                     "delivery_id": dlv["id"],
                     "site_address": dlv["destination"],
-                    "status": self._rng.choice(
-                        ["planned", "site_prep", "installing", "commissioning", "completed"]
-                    ),
+                    "status": self._rng.choice(_DEPLOYMENT_STATUSES),
                     "installation_checklist_json": json.dumps(
                         {
                             "foundation_check": True,
                             "utility_connections": True,
                             "module_alignment": True,
-                            "smart_system_boot": self._rng.choice([True, False]),
-                            "final_inspection": self._rng.choice([True, False]),
+                            "smart_system_boot": self._rng.choice(_BOOLS),
+                            "final_inspection": self._rng.choice(_BOOLS),
                         }
                     ),
                     "commissioning_date": self._random_date(2025, 2026).isoformat(),
@@ -816,7 +830,7 @@ class SeedGenerator:
                     ),
                     "contact_email": f"partnerships@{name.lower().replace(' ', '')[:15]}.eu",
                     "rating": round(self._rng.uniform(3.5, 5.0), 1),
-                    "lead_time_days": self._rng.choice([21, 30, 45, 60]),
+                    "lead_time_days": self._rng.choice(_PARTNER_LEAD_TIMES),
                     **self._provenance(),
                 }
             )
@@ -959,7 +973,7 @@ class SeedGenerator:
                         "total_price": round(units * price_per, 2),
                         "lead_time_days": partner["lead_time_days"] + self._rng.randint(-5, 10),
                         "valid_until": self._random_date(2025, 2026).isoformat(),
-                        "status": self._rng.choice(["active", "active", "expired"]),
+                        "status": self._rng.choice(_QUOTE_STATUSES),
                         **self._provenance(),
                     }
                 )
@@ -1043,7 +1057,7 @@ class SeedGenerator:
                             }
                         ]
                     )
-                    result = self._rng.choice(["pass", "pass", "pass", "minor_defect"])
+                    result = self._rng.choice(_QA_RESULTS)
 
                 items.append(
                     {
@@ -1098,7 +1112,7 @@ class SeedGenerator:
                             "key_metrics": {
                                 "primary": round(self._rng.uniform(60, 99), 1),
                                 "secondary": round(self._rng.uniform(40, 95), 1),
-                                "trend": self._rng.choice(["up", "stable", "down"]),
+                                "trend": self._rng.choice(_TRENDS),
                             },
                             "recommendations": [
                                 "Continue monitoring key indicators.",
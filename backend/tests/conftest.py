@@ -6,17 +6,37 @@ SeedGenerator directly or mock the database dependency.
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import pytest
-from httpx import ASGITransport, AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient, Limits, Response
 
 from app.api.deps import get_seed_data
 from app.core.config import settings
+from app.main import app
 from app.seed.generator import SeedGenerator
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+
+    # check_list_endpoint(url, list_key, count_keys, item_keys, *, seeded)
+    ListEndpointCheck = Callable[..., Awaitable[None]]
+
+# ── Command-line options ─────────────────────────────────────────────────────
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register ``--update-golden`` for tests that pin response digests."""
+    parser.addoption(
+        "--update-golden",
+        action="store_true",
+        default=False,
+        help="Report freshly computed golden digests instead of asserting against them.",
+    )
+
 
 # ── Override settings for test environment ────────────────────────────────────
 
@@ -29,17 +49,79 @@ def _force_dev_mode(monkeypatch: pytest.MonkeyPatch) -> None:
 
 # ── Async HTTP client ────────────────────────────────────────────────────────
 
+# ECOPLANTA_TEST_MODE=integration points the suite at a running server
+# (ECOPLANTA_TEST_BASE_URL) instead of the in-process ASGI app.  Seed-derived
+# ids and ``seed_data`` still come from the local settings.SEED, so the server
+# must be started with the same SEED.
+_INTEGRATION_MODE = os.environ.get("ECOPLANTA_TEST_MODE") == "integration"
+_TEST_BASE_URL = os.environ.get("ECOPLANTA_TEST_BASE_URL", "http://localhost:8000")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_response_decoding() -> Iterator[None]:
+    """Decode ``Response.json()`` with orjson instead of the stdlib parser."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Response, "json", lambda self, **_: orjson.loads(self.content))
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client() -> AsyncGenerator[AsyncClient, None]:
-    """Yield an ``httpx.AsyncClient`` wired to the FastAPI app via ASGI transport."""
-    from app.main import app
+    """Yield an ``httpx.AsyncClient`` wired to the FastAPI app via ASGI transport.
+
+    One client is shared by the whole session; tests run on the same
+    session-scoped event loop (see ``[tool.pytest.ini_options]``).
+
+    In integration mode the client talks to a live server over one pooled
+    connection set instead.  HTTP/2 is negotiated when the server offers it
+    over TLS (e.g. behind a reverse proxy); plain uvicorn falls back to
+    HTTP/1.1 keep-alive.  Server-side settings such as ``DEV_MODE`` are then
+    whatever the server was started with.
+    """
+    if _INTEGRATION_MODE:
+        limits = Limits(max_keepalive_connections=100, max_connections=100, keepalive_expiry=60)
+        async with AsyncClient(base_url=_TEST_BASE_URL, http2=True, limits=limits) as ac:
+            yield ac
+        return
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
         yield ac
 
 
+# ── Shared checks ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def check_list_endpoint(client: AsyncClient) -> ListEndpointCheck:
+    """Return the list-endpoint check shared by the per-module endpoint tables."""
+
+    async def check(
+        url: str,
+        list_key: str,
+        count_keys: tuple[str, ...],
+        item_keys: tuple[str, ...],
+        *,
+        seeded: bool,
+    ) -> None:
+        resp = await client.get(url)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert len(body[list_key]) > 0
+        for key in count_keys:
+            assert body[key] > 0, f"{url}: {key} should be positive"
+        first = body[list_key][0]
+        for key in item_keys:
+            assert key in first, f"{url}: first {list_key} item missing {key}"
+        if seeded:
+            offenders = [
+                item["id"] for item in body[list_key] if item["source"] != "synthetic_seeded"
+            ]
+            assert not offenders, f"{url}: items missing source='synthetic_seeded': {offenders}"
+
+    return check
+
+
 # ── Seed data fixtures ───────────────────────────────────────────────────────
 
 
@@ -49,7 +131,7 @@ def seed_generator() -> SeedGenerator:
     return SeedGenerator(seed=settings.SEED)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def seed_data() -> dict[str, Any]:
-    """Return the full seed data dict (cached)."""
+    """Return the full seed data dict, shared across the whole session."""
     return get_seed_data()
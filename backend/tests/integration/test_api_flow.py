@@ -7,34 +7,86 @@ approach as unit tests but focused on multi-endpoint flows.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any
 
-import pytest
+import pytest_asyncio
+
+from app.api.deps import get_seed_data
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from httpx import AsyncClient
 
+_LSF_RE = re.compile(r"lsf|light steel frame", re.IGNORECASE)
+
+_NAVIGATION_ENDPOINTS = (
+    "/health",
+    "/me",
+    "/api/fabric",
+    "/api/fabric/scene",
+    "/api/frameworks",
+    "/api/sales",
+    "/api/intelligence",
+    "/api/deploy",
+    "/api/partners",
+)
+
+# (endpoint, list key) pairs whose items must all carry provenance
+_PROVENANCE_CHECKS = (
+    ("/api/fabric", "production_lines"),
+    ("/api/sales", "leads"),
+    ("/api/deploy", "deliveries"),
+    ("/api/partners", "partners"),
+    ("/api/intelligence", "insights"),
+)
+_PHASE2_PROVENANCE_CHECKS = (
+    ("/api/factory/workorders", "work_orders"),
+    ("/api/factory/inventory", "items"),
+)
+
+
+async def _get_statuses(client: AsyncClient, endpoints: Sequence[str]) -> dict[str, int]:
+    """GET every endpoint concurrently and return ``{endpoint: status_code}``.
+
+    Only the status line matters to the callers, so bodies are never read.
+    """
+
+    async def status(ep: str) -> int:
+        async with client.stream("GET", ep) as resp:
+            return resp.status_code
+
+    codes = await asyncio.gather(*(status(ep) for ep in endpoints))
+    return dict(zip(endpoints, codes, strict=True))
+
+
+async def _assert_provenance(client: AsyncClient, checks: Sequence[tuple[str, str]]) -> None:
+    """Assert every endpoint lists items and that all of them are synthetic_seeded."""
+    empty: list[str] = []
+    offenders: list[tuple[str, Any]] = []
+    for endpoint, key in checks:
+        resp = await client.get(endpoint)
+        items = resp.json().get(key, [])
+        if not items:
+            empty.append(f"{endpoint}/{key}")
+        offenders.extend(
+            (endpoint, item.get("id"))
+            for item in items
+            if item.get("source") != "synthetic_seeded"
+        )
+    assert not empty, f"Endpoints returned no items: {empty}"
+    assert not offenders, f"Items missing provenance: {offenders}"
+
 
-@pytest.mark.asyncio
 async def test_full_navigation_flow(client: AsyncClient) -> None:
     """Simulate a user navigating all 6 modules — every endpoint returns 200."""
-    endpoints = [
-        "/health",
-        "/me",
-        "/api/fabric",
-        "/api/fabric/scene",
-        "/api/frameworks",
-        "/api/sales",
-        "/api/intelligence",
-        "/api/deploy",
-        "/api/partners",
-    ]
-    for ep in endpoints:
-        resp = await client.get(ep)
-        assert resp.status_code == 200, f"{ep} returned {resp.status_code}"
+    statuses = await _get_statuses(client, _NAVIGATION_ENDPOINTS)
+    failed = {ep: code for ep, code in statuses.items() if code != 200}
+    assert not failed, f"Non-200 responses: {failed}"
 
 
-@pytest.mark.asyncio
 async def test_fabric_scene_has_objects(client: AsyncClient) -> None:
     """3D scene endpoint must return at least one scene object."""
     resp = await client.get("/api/fabric/scene")
@@ -46,7 +98,6 @@ async def test_fabric_scene_has_objects(client: AsyncClient) -> None:
     assert "name" in obj
 
 
-@pytest.mark.asyncio
 async def test_sales_pipeline_consistency(client: AsyncClient) -> None:
     """Sales pipeline stats must be consistent with the lead list."""
     resp = await client.get("/api/sales")
@@ -57,18 +108,19 @@ async def test_sales_pipeline_consistency(client: AsyncClient) -> None:
     assert pipeline["total_pipeline_value"] >= 0
 
 
-@pytest.mark.asyncio
 async def test_frameworks_no_lsf(client: AsyncClient) -> None:
     """Frameworks endpoint must never include LSF materials."""
     resp = await client.get("/api/frameworks")
     body = resp.json()
-    for mat in body.get("materials", []):
-        name_lower = mat["name"].lower()
-        assert "lsf" not in name_lower, f"LSF material found: {mat['name']}"
-        assert "light steel frame" not in name_lower
+    offenders = [
+        (fw["id"], m["name"])
+        for fw in body["frameworks"]
+        for m in fw["materials"]
+        if _LSF_RE.search(m["name"])
+    ]
+    assert not offenders, f"LSF materials in frameworks: {offenders}"
 
 
-@pytest.mark.asyncio
 async def test_deploy_has_deliveries(client: AsyncClient) -> None:
     """Deploy module must return deliveries with status info."""
     resp = await client.get("/api/deploy")
@@ -81,17 +133,15 @@ async def test_deploy_has_deliveries(client: AsyncClient) -> None:
     assert "destination" in delivery
 
 
-@pytest.mark.asyncio
 async def test_partners_eu_coverage(client: AsyncClient) -> None:
     """Partners must be EU-based."""
     resp = await client.get("/api/partners")
     body = resp.json()
     assert body["total_partners"] > 0
-    for partner in body["partners"]:
-        assert partner["country"], f"Partner {partner['name']} has no country"
+    missing = [partner["name"] for partner in body["partners"] if not partner["country"]]
+    assert not missing, f"Partners without a country: {missing}"
 
 
-@pytest.mark.asyncio
 async def test_intelligence_insights(client: AsyncClient) -> None:
     """Intelligence endpoint must return insight reports."""
     resp = await client.get("/api/intelligence")
@@ -102,35 +152,20 @@ async def test_intelligence_insights(client: AsyncClient) -> None:
     assert "module" in insight
 
 
-@pytest.mark.asyncio
 async def test_provenance_on_all_modules(client: AsyncClient) -> None:
     """Every list item across modules must carry provenance metadata."""
-    module_checks = [
-        ("/api/fabric", "production_lines"),
-        ("/api/sales", "leads"),
-        ("/api/deploy", "deliveries"),
-        ("/api/partners", "partners"),
-        ("/api/intelligence", "insights"),
-    ]
-    for endpoint, key in module_checks:
-        resp = await client.get(endpoint)
-        body = resp.json()
-        items = body.get(key, [])
-        assert len(items) > 0, f"{endpoint} has no {key}"
-        for item in items:
-            assert item.get("source") == "synthetic_seeded", (
-                f"{endpoint}/{key} item missing provenance: {item.get('source')}"
-            )
+    await _assert_provenance(client, _PROVENANCE_CHECKS)
 
 
-@pytest.mark.asyncio
 async def test_security_headers_on_all_endpoints(client: AsyncClient) -> None:
     """Security headers must be present on every response."""
     endpoints = ["/health", "/api/fabric", "/api/sales"]
     for ep in endpoints:
-        resp = await client.get(ep)
-        assert "x-content-type-options" in resp.headers, f"Missing X-Content-Type-Options on {ep}"
-        assert resp.headers["x-content-type-options"] == "nosniff"
+        async with client.stream("GET", ep) as resp:
+            assert "x-content-type-options" in resp.headers, (
+                f"Missing X-Content-Type-Options on {ep}"
+            )
+            assert resp.headers["x-content-type-options"] == "nosniff"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -138,14 +173,13 @@ async def test_security_headers_on_all_endpoints(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_full_enterprise_flow(client: AsyncClient) -> None:
-    """Full flow: Lead -> Opportunity -> Contract -> BOM -> WorkOrder -> QA -> Delivery -> Job.
+# Each fixture performs (and asserts) one state-changing step of the flow, so
+# any step test can run on its own: pytest builds only the chain it needs.
 
-    This test exercises the entire enterprise pipeline end-to-end using
-    both seeded data and the new CRUD endpoints.
-    """
-    # ── Step 1: Create a new lead ────────────────────────────────────
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def lead(client: AsyncClient) -> dict[str, Any]:
+    """A lead created through the API."""
     resp = await client.post(
         "/api/sales/leads",
         json={
@@ -156,142 +190,193 @@ async def test_full_enterprise_flow(client: AsyncClient) -> None:
         },
     )
     assert resp.status_code == 201
-    lead = resp.json()
-    lead_id = lead["id"]
-    assert lead["status"] == "new"
+    return resp.json()
 
-    # ── Step 2: Progress lead through stages ─────────────────────────
-    for stage in ["contacted", "qualified", "proposal", "negotiation", "won"]:
-        resp = await client.patch(
-            f"/api/sales/leads/{lead_id}",
-            json={"status": stage},
-        )
-        assert resp.status_code == 200
-        assert resp.json()["status"] == stage
 
-    # ── Step 3: Verify pipeline stats reflect new lead ───────────────
-    resp = await client.get("/api/sales/pipeline/stats")
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def won_lead(client: AsyncClient, lead: dict[str, Any]) -> dict[str, Any]:
+    """``lead`` closed as won."""
+    # Per-stage transitions are covered by the unit tests; the flow only
+    # needs the lead to reach its terminal stage.
+    resp = await client.patch(f"/api/sales/leads/{lead['id']}", json={"status": "won"})
     assert resp.status_code == 200
-    stats = resp.json()
-    assert stats["total_leads"] > 0
-    # Lisboa territory should exist
-    lisboa = [t for t in stats["territories"] if t["region"] == "Lisboa"]
-    assert len(lisboa) > 0
+    return resp.json()
 
-    # ── Step 4: Get a BOM (from seed data) ───────────────────────────
-    from app.api.deps import get_seed_data
 
-    seed = get_seed_data()
-    bom_id = seed["boms"][0]["id"]
-
-    resp = await client.get(f"/api/factory/bom/{bom_id}")
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def bom(client: AsyncClient) -> dict[str, Any]:
+    """The first seeded BOM, fetched through the API."""
+    resp = await client.get(f"/api/factory/bom/{get_seed_data()['boms'][0]['id']}")
     assert resp.status_code == 200
-    bom = resp.json()
-    assert bom["id"] == bom_id
-    assert len(bom["items"]) > 0
+    return resp.json()
 
-    # ── Step 5: Create a work order from BOM ─────────────────────────
-    resp = await client.post(
-        "/api/factory/workorders",
-        json={"bom_id": bom_id, "priority": 1},
-    )
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def work_order(client: AsyncClient, bom: dict[str, Any]) -> dict[str, Any]:
+    """A work order created from ``bom``."""
+    resp = await client.post("/api/factory/workorders", json={"bom_id": bom["id"], "priority": 1})
     assert resp.status_code == 201
-    wo = resp.json()
-    wo_id = wo["id"]
-    assert wo["status"] == "planned"
-    assert wo["bom_id"] == bom_id
+    return resp.json()
 
-    # ── Step 6: Progress work order through manufacturing ────────────
-    for status in ["scheduled", "in_progress", "completed"]:
-        resp = await client.patch(
-            f"/api/factory/workorders/{wo_id}/status",
-            json={"status": status},
-        )
-        assert resp.status_code == 200
-        assert resp.json()["status"] == status
 
-    # ── Step 7: Check QA records exist ───────────────────────────────
-    resp = await client.get("/api/factory/qa")
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def completed_work_order(client: AsyncClient, work_order: dict[str, Any]) -> dict[str, Any]:
+    """``work_order`` moved straight to completed."""
+    resp = await client.patch(
+        f"/api/factory/workorders/{work_order['id']}/status",
+        json={"status": "completed"},
+    )
     assert resp.status_code == 200
-    qa = resp.json()
-    assert qa["summary"]["total_inspections"] > 0
+    return resp.json()
 
-    # ── Step 8: Check inventory levels ───────────────────────────────
-    resp = await client.get("/api/factory/inventory")
-    assert resp.status_code == 200
-    inv = resp.json()
-    assert inv["total"] > 0
 
-    # ── Step 9: Create a delivery ────────────────────────────────────
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def delivery(client: AsyncClient, completed_work_order: dict[str, Any]) -> dict[str, Any]:
+    """A delivery created for ``completed_work_order``."""
     resp = await client.post(
         "/api/deploy/deliveries",
         json={
-            "work_order_id": wo_id,
+            "work_order_id": completed_work_order["id"],
             "destination": "Lisboa, Portugal",
             "carrier": "EcoFreight Iberia",
         },
     )
     assert resp.status_code == 201
-    delivery = resp.json()
-    dlv_id = delivery["id"]
-    assert delivery["status"] == "preparing"
+    return resp.json()
+
+
+class TestEnterpriseFlow:
+    """Full flow: Lead -> Opportunity -> Contract -> BOM -> WorkOrder -> QA -> Delivery -> Job.
+
+    Each step of the enterprise pipeline is its own test.  The records a
+    step builds on come from the class-scoped fixtures above, so a step run
+    alone (``-k``, ``--lf``, another xdist worker) creates its prerequisites
+    itself, and a failing prerequisite errors the steps that need it.
+    """
+
+    # ── Step 1: Create a new lead ────────────────────────────────────
+    async def test_step01_create_lead(self, lead: dict[str, Any]) -> None:
+        assert lead["status"] == "new"
+        assert lead["region"] == "Lisboa"
+
+    # ── Step 2: Close the lead as won ────────────────────────────────
+    async def test_step02_win_lead(self, lead: dict[str, Any], won_lead: dict[str, Any]) -> None:
+        assert won_lead["id"] == lead["id"]
+        assert won_lead["status"] == "won"
+
+    # ── Step 3: Verify pipeline stats reflect new lead ───────────────
+    async def test_step03_pipeline_stats(
+        self, client: AsyncClient, won_lead: dict[str, Any]
+    ) -> None:
+        resp = await client.get("/api/sales/pipeline/stats")
+        assert resp.status_code == 200
+        stats = resp.json()
+        assert stats["total_leads"] > 0
+        # Lisboa territory should exist
+        lisboa = [t for t in stats["territories"] if t["region"] == "Lisboa"]
+        assert len(lisboa) > 0
+
+    # ── Step 4: Get a BOM (from seed data) ───────────────────────────
+    async def test_step04_get_bom(self, bom: dict[str, Any]) -> None:
+        assert bom["id"] == get_seed_data()["boms"][0]["id"]
+        assert len(bom["items"]) > 0
+
+    # ── Step 5: Create a work order from BOM ─────────────────────────
+    async def test_step05_create_work_order(
+        self, bom: dict[str, Any], work_order: dict[str, Any]
+    ) -> None:
+        assert work_order["status"] == "planned"
+        assert work_order["bom_id"] == bom["id"]
+
+    # ── Step 6: Complete the work order ──────────────────────────────
+    async def test_step06_complete_work_order(
+        self, client: AsyncClient, completed_work_order: dict[str, Any]
+    ) -> None:
+        assert completed_work_order["status"] == "completed"
+        resp = await client.get(f"/api/factory/workorders/{completed_work_order['id']}")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "completed"
+
+    # ── Step 7: Check QA records exist ───────────────────────────────
+    async def test_step07_qa_records(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/factory/qa")
+        assert resp.status_code == 200
+        qa = resp.json()
+        assert qa["summary"]["total_inspections"] > 0
+
+    # ── Step 8: Check inventory levels ───────────────────────────────
+    async def test_step08_inventory(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/factory/inventory")
+        assert resp.status_code == 200
+        inv = resp.json()
+        assert inv["total"] > 0
+
+    # ── Step 9: Create a delivery ────────────────────────────────────
+    async def test_step09_create_delivery(
+        self, completed_work_order: dict[str, Any], delivery: dict[str, Any]
+    ) -> None:
+        assert delivery["status"] == "preparing"
+        assert delivery["work_order_id"] == completed_work_order["id"]
 
     # ── Step 10: Progress delivery ───────────────────────────────────
-    resp = await client.patch(
-        f"/api/deploy/deliveries/{dlv_id}/status",
-        json={"status": "in_transit"},
-    )
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "in_transit"
+    async def test_step10_progress_delivery(
+        self, client: AsyncClient, delivery: dict[str, Any]
+    ) -> None:
+        resp = await client.patch(
+            f"/api/deploy/deliveries/{delivery['id']}/status",
+            json={"status": "in_transit"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "in_transit"
 
-    resp = await client.patch(
-        f"/api/deploy/deliveries/{dlv_id}/status",
-        json={"status": "delivered"},
-    )
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "delivered"
+        resp = await client.patch(
+            f"/api/deploy/deliveries/{delivery['id']}/status",
+            json={"status": "delivered"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "delivered"
 
     # ── Step 11: Get a deployment job and update its checklist ────────
-    job_id = seed["deployment_jobs"][0]["id"]
-    resp = await client.get(f"/api/deploy/jobs/{job_id}")
-    assert resp.status_code == 200
-    job = resp.json()
-    assert "checklist" in job
+    async def test_step11_complete_checklist(self, client: AsyncClient) -> None:
+        job_id = get_seed_data()["deployment_jobs"][0]["id"]
+        resp = await client.get(f"/api/deploy/jobs/{job_id}")
+        assert resp.status_code == 200
+        job = resp.json()
+        assert "checklist" in job
 
-    resp = await client.patch(
-        f"/api/deploy/jobs/{job_id}/checklist",
-        json={
-            "items": {
-                "foundation_check": True,
-                "utility_connections": True,
-                "module_alignment": True,
-                "smart_system_boot": True,
-                "final_inspection": True,
-            }
-        },
-    )
-    assert resp.status_code == 200
-    updated_job = resp.json()
-    assert updated_job["checklist"]["completion_pct"] == 100.0
+        resp = await client.patch(
+            f"/api/deploy/jobs/{job_id}/checklist",
+            json={
+                "items": {
+                    "foundation_check": True,
+                    "utility_connections": True,
+                    "module_alignment": True,
+                    "smart_system_boot": True,
+                    "final_inspection": True,
+                }
+            },
+        )
+        assert resp.status_code == 200
+        updated_job = resp.json()
+        assert updated_job["checklist"]["completion_pct"] == 100.0
 
     # ── Step 12: Check commissioning overview ────────────────────────
-    resp = await client.get("/api/deploy/commissioning")
-    assert resp.status_code == 200
-    comm = resp.json()
-    assert comm["total"] > 0
+    async def test_step12_commissioning(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/deploy/commissioning")
+        assert resp.status_code == 200
+        comm = resp.json()
+        assert comm["total"] > 0
 
     # ── Step 13: Check delivery schedule ─────────────────────────────
-    resp = await client.get("/api/deploy/schedule")
-    assert resp.status_code == 200
-    schedule = resp.json()
-    assert "schedule" in schedule
+    async def test_step13_schedule(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/deploy/schedule")
+        assert resp.status_code == 200
+        schedule = resp.json()
+        assert "schedule" in schedule
 
 
-@pytest.mark.asyncio
 async def test_all_phase2_endpoints_return_200(client: AsyncClient) -> None:
     """Every new Phase 2 GET endpoint should return 200."""
-    from app.api.deps import get_seed_data
-
     seed = get_seed_data()
 
     endpoints = [
@@ -305,24 +390,11 @@ async def test_all_phase2_endpoints_return_200(client: AsyncClient) -> None:
         f"/api/deploy/jobs/{seed['deployment_jobs'][0]['id']}",
         "/api/deploy/commissioning",
     ]
-    for ep in endpoints:
-        resp = await client.get(ep)
-        assert resp.status_code == 200, f"{ep} returned {resp.status_code}"
+    statuses = await _get_statuses(client, endpoints)
+    failed = {ep: code for ep, code in statuses.items() if code != 200}
+    assert not failed, f"Non-200 responses: {failed}"
 
 
-@pytest.mark.asyncio
 async def test_phase2_provenance_on_all_modules(client: AsyncClient) -> None:
     """All Phase 2 list endpoints should carry source='synthetic_seeded'."""
-    checks = [
-        ("/api/factory/workorders", "work_orders"),
-        ("/api/factory/inventory", "items"),
-    ]
-    for endpoint, key in checks:
-        resp = await client.get(endpoint)
-        body = resp.json()
-        items = body.get(key, [])
-        assert len(items) > 0, f"{endpoint} has no {key}"
-        for item in items:
-            assert item.get("source") == "synthetic_seeded", (
-                f"{endpoint}/{key} item missing provenance: {item.get('source')}"
-            )
+    await _assert_provenance(client, _PHASE2_PROVENANCE_CHECKS)
@@ -6,12 +6,10 @@ and delivery scheduling -- all without a running database.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from app.api.deps import get_seed_data
-
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
@@ -21,7 +19,6 @@ if TYPE_CHECKING:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_sales_pipeline_stats(client: AsyncClient) -> None:
     """GET /api/sales/pipeline/stats should return 200 with stage analytics."""
     resp = await client.get("/api/sales/pipeline/stats")
@@ -41,7 +38,6 @@ async def test_sales_pipeline_stats(client: AsyncClient) -> None:
     assert "lost" in stage_names
 
 
-@pytest.mark.asyncio
 async def test_sales_pipeline_territories(client: AsyncClient) -> None:
     """Pipeline stats should include Portuguese territory breakdown."""
     resp = await client.get("/api/sales/pipeline/stats")
@@ -55,7 +51,6 @@ async def test_sales_pipeline_territories(client: AsyncClient) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_sales_pipeline_conversions(client: AsyncClient) -> None:
     """Pipeline stats should include stage-to-stage conversion metrics."""
     resp = await client.get("/api/sales/pipeline/stats")
@@ -69,7 +64,6 @@ async def test_sales_pipeline_conversions(client: AsyncClient) -> None:
         assert "avg_days" in conv
 
 
-@pytest.mark.asyncio
 async def test_create_lead(client: AsyncClient) -> None:
     """POST /api/sales/leads should create a new lead and return 201."""
     resp = await client.post(
@@ -90,26 +84,25 @@ async def test_create_lead(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
-async def test_update_lead_stage(client: AsyncClient) -> None:
-    """PATCH /api/sales/leads/{id} should update a lead's status."""
-    data = get_seed_data()
-    lead_id = data["leads"][0]["id"]
+@pytest.mark.parametrize("stage", ["contacted", "qualified", "proposal", "negotiation", "won"])
+async def test_update_lead_stage(
+    client: AsyncClient, seed_data: dict[str, Any], stage: str
+) -> None:
+    """PATCH /api/sales/leads/{id} should move a lead into each pipeline stage."""
+    lead_id = seed_data["leads"][0]["id"]
     resp = await client.patch(
         f"/api/sales/leads/{lead_id}",
-        json={"status": "qualified"},
+        json={"status": stage},
     )
     assert resp.status_code == 200
     body = resp.json()
-    assert body["status"] == "qualified"
+    assert body["status"] == stage
     assert body["id"] == lead_id
 
 
-@pytest.mark.asyncio
-async def test_update_lead_stage_invalid(client: AsyncClient) -> None:
+async def test_update_lead_stage_invalid(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """PATCH with invalid status should return 422."""
-    data = get_seed_data()
-    lead_id = data["leads"][0]["id"]
+    lead_id = seed_data["leads"][0]["id"]
     resp = await client.patch(
         f"/api/sales/leads/{lead_id}",
         json={"status": "invalid_status"},
@@ -117,7 +110,6 @@ async def test_update_lead_stage_invalid(client: AsyncClient) -> None:
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_update_lead_not_found(client: AsyncClient) -> None:
     """PATCH with non-existent lead_id should return 404."""
     resp = await client.patch(
@@ -132,7 +124,6 @@ async def test_update_lead_not_found(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_factory_workorders_list(client: AsyncClient) -> None:
     """GET /api/factory/workorders should return 200 with work orders."""
     resp = await client.get("/api/factory/workorders")
@@ -148,11 +139,9 @@ async def test_factory_workorders_list(client: AsyncClient) -> None:
     assert "status_history" in wo
 
 
-@pytest.mark.asyncio
-async def test_factory_workorder_detail(client: AsyncClient) -> None:
+async def test_factory_workorder_detail(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/factory/workorders/{id} should return 200 with full detail."""
-    data = get_seed_data()
-    wo_id = data["work_orders"][0]["id"]
+    wo_id = seed_data["work_orders"][0]["id"]
     resp = await client.get(f"/api/factory/workorders/{wo_id}")
     assert resp.status_code == 200
     body = resp.json()
@@ -161,18 +150,15 @@ async def test_factory_workorder_detail(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
 async def test_factory_workorder_not_found(client: AsyncClient) -> None:
     """GET /api/factory/workorders/{bad_id} should return 404."""
     resp = await client.get("/api/factory/workorders/nonexistent-id")
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_factory_create_workorder(client: AsyncClient) -> None:
+async def test_factory_create_workorder(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """POST /api/factory/workorders should create a work order and return 201."""
-    data = get_seed_data()
-    bom_id = data["boms"][0]["id"]
+    bom_id = seed_data["boms"][0]["id"]
     resp = await client.post(
         "/api/factory/workorders",
         json={"bom_id": bom_id, "priority": 2},
@@ -185,7 +171,6 @@ async def test_factory_create_workorder(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
 async def test_factory_create_workorder_bad_bom(client: AsyncClient) -> None:
     """POST with non-existent BOM should return 404."""
     resp = await client.post(
@@ -195,21 +180,21 @@ async def test_factory_create_workorder_bad_bom(client: AsyncClient) -> None:
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_factory_update_workorder_status(client: AsyncClient) -> None:
-    """PATCH /api/factory/workorders/{id}/status should update status."""
-    data = get_seed_data()
-    wo_id = data["work_orders"][0]["id"]
+@pytest.mark.parametrize("status", ["scheduled", "in_progress", "completed"])
+async def test_factory_update_workorder_status(
+    client: AsyncClient, seed_data: dict[str, Any], status: str
+) -> None:
+    """PATCH /api/factory/workorders/{id}/status should move a WO through manufacturing."""
+    wo_id = seed_data["work_orders"][0]["id"]
     resp = await client.patch(
         f"/api/factory/workorders/{wo_id}/status",
-        json={"status": "in_progress"},
+        json={"status": status},
     )
     assert resp.status_code == 200
     body = resp.json()
-    assert body["status"] == "in_progress"
+    assert body["status"] == status
 
 
-@pytest.mark.asyncio
 async def test_factory_inventory(client: AsyncClient) -> None:
     """GET /api/factory/inventory should return 200 with stock data."""
     resp = await client.get("/api/factory/inventory")
@@ -225,7 +210,6 @@ async def test_factory_inventory(client: AsyncClient) -> None:
     assert item["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
 async def test_factory_qa(client: AsyncClient) -> None:
     """GET /api/factory/qa should return 200 with QA records and summary."""
     resp = await client.get("/api/factory/qa")
@@ -239,11 +223,9 @@ async def test_factory_qa(client: AsyncClient) -> None:
     assert summary["total_inspections"] > 0
 
 
-@pytest.mark.asyncio
-async def test_factory_bom_detail(client: AsyncClient) -> None:
+async def test_factory_bom_detail(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/factory/bom/{id} should return 200 with BOM details."""
-    data = get_seed_data()
-    bom_id = data["boms"][0]["id"]
+    bom_id = seed_data["boms"][0]["id"]
     resp = await client.get(f"/api/factory/bom/{bom_id}")
     assert resp.status_code == 200
     body = resp.json()
@@ -254,7 +236,6 @@ async def test_factory_bom_detail(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
 async def test_factory_bom_not_found(client: AsyncClient) -> None:
     """GET /api/factory/bom/{bad_id} should return 404."""
     resp = await client.get("/api/factory/bom/nonexistent-bom-id")
@@ -266,7 +247,6 @@ async def test_factory_bom_not_found(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_deploy_schedule(client: AsyncClient) -> None:
     """GET /api/deploy/schedule should return 200 with calendar data."""
     resp = await client.get("/api/deploy/schedule")
@@ -278,11 +258,9 @@ async def test_deploy_schedule(client: AsyncClient) -> None:
     assert "total_installations" in body
 
 
-@pytest.mark.asyncio
-async def test_deploy_create_delivery(client: AsyncClient) -> None:
+async def test_deploy_create_delivery(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """POST /api/deploy/deliveries should create a delivery and return 201."""
-    data = get_seed_data()
-    wo_id = data["work_orders"][0]["id"]
+    wo_id = seed_data["work_orders"][0]["id"]
     resp = await client.post(
         "/api/deploy/deliveries",
         json={
@@ -299,11 +277,11 @@ async def test_deploy_create_delivery(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
-async def test_deploy_update_delivery_status(client: AsyncClient) -> None:
+async def test_deploy_update_delivery_status(
+    client: AsyncClient, seed_data: dict[str, Any]
+) -> None:
     """PATCH /api/deploy/deliveries/{id}/status should update status."""
-    data = get_seed_data()
-    dlv_id = data["deliveries"][0]["id"]
+    dlv_id = seed_data["deliveries"][0]["id"]
     resp = await client.patch(
         f"/api/deploy/deliveries/{dlv_id}/status",
         json={"status": "in_transit"},
@@ -313,7 +291,6 @@ async def test_deploy_update_delivery_status(client: AsyncClient) -> None:
     assert body["status"] == "in_transit"
 
 
-@pytest.mark.asyncio
 async def test_deploy_delivery_not_found(client: AsyncClient) -> None:
     """PATCH with non-existent delivery should return 404."""
     resp = await client.patch(
@@ -323,11 +300,9 @@ async def test_deploy_delivery_not_found(client: AsyncClient) -> None:
     assert resp.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_deploy_job_detail(client: AsyncClient) -> None:
+async def test_deploy_job_detail(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/deploy/jobs/{id} should return 200 with checklist."""
-    data = get_seed_data()
-    job_id = data["deployment_jobs"][0]["id"]
+    job_id = seed_data["deployment_jobs"][0]["id"]
     resp = await client.get(f"/api/deploy/jobs/{job_id}")
     assert resp.status_code == 200
     body = resp.json()
@@ -339,11 +314,9 @@ async def test_deploy_job_detail(client: AsyncClient) -> None:
     assert body["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
-async def test_deploy_update_checklist(client: AsyncClient) -> None:
+async def test_deploy_update_checklist(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """PATCH /api/deploy/jobs/{id}/checklist should update checklist items."""
-    data = get_seed_data()
-    job_id = data["deployment_jobs"][0]["id"]
+    job_id = seed_data["deployment_jobs"][0]["id"]
     resp = await client.patch(
         f"/api/deploy/jobs/{job_id}/checklist",
         json={"items": {"foundation_check": True, "final_inspection": True}},
@@ -357,7 +330,6 @@ async def test_deploy_update_checklist(client: AsyncClient) -> None:
     assert items_by_key["final_inspection"]["completed"] is True
 
 
-@pytest.mark.asyncio
 async def test_deploy_commissioning(client: AsyncClient) -> None:
     """GET /api/deploy/commissioning should return 200 with overview."""
     resp = await client.get("/api/deploy/commissioning")
@@ -371,7 +343,6 @@ async def test_deploy_commissioning(client: AsyncClient) -> None:
     assert body["total"] > 0
 
 
-@pytest.mark.asyncio
 async def test_deploy_job_not_found(client: AsyncClient) -> None:
     """GET /api/deploy/jobs/{bad_id} should return 404."""
     resp = await client.get("/api/deploy/jobs/nonexistent-id")
@@ -383,7 +354,6 @@ async def test_deploy_job_not_found(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_factory_provenance(client: AsyncClient) -> None:
     """Factory work orders should carry source='synthetic_seeded'."""
     resp = await client.get("/api/factory/workorders")
@@ -392,7 +362,6 @@ async def test_factory_provenance(client: AsyncClient) -> None:
         assert wo["source"] == "synthetic_seeded"
 
 
-@pytest.mark.asyncio
 async def test_factory_inventory_provenance(client: AsyncClient) -> None:
     """Factory inventory items should carry source='synthetic_seeded'."""
     resp = await client.get("/api/factory/inventory")
@@ -6,40 +6,127 @@ all without a running database.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import re
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import pytest
 
 from app.api.deps import get_seed_data
+from app.core.config import settings
 
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
+    from tests.conftest import ListEndpointCheck
+
+_LSF_RE = re.compile(r"lsf|light steel frame|light gauge", re.IGNORECASE)
+
+# Static request bodies, encoded once at import rather than on every call
+_JSON_HEADERS = {"content-type": "application/json"}
+_EXPERIMENT_BODY = orjson.dumps(
+    {
+        "description": "Thermal cycling test at -20C to +60C",
+        "result": "Passed 500 cycles with no degradation",
+    }
+)
+_ALLOC_BODY = orjson.dumps({"order_units": 10})
+_ALLOC_GERMANY_BODY = orjson.dumps({"order_units": 5, "preferred_country": "Germany"})
+_FORECAST_BODY = orjson.dumps({"horizon_periods": 6, "confidence_level": 0.95})
+_ANOMALY_BODY = orjson.dumps({"threshold": 2.0})
+_TRAIN_BODY = orjson.dumps(
+    {
+        "model_name": "test-model",
+        "features": ["scheduled_duration_days", "priority"],
+        "target": "lead_time_days",
+    }
+)
+
+
+# Detail-test id argument -> seed entity list it draws ids from
+_SEED_ID_PARAMS = {
+    "material_id": "materials",
+    "patent_id": "patents",
+    "partner_id": "partners",
+    "framework_id": "frameworks",
+}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize this module's ``*_id`` arguments with the first three seeded ids."""
+    for argname, entity in _SEED_ID_PARAMS.items():
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(argname, [rec["id"] for rec in get_seed_data()[entity][:3]])
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# Phase 3: Materials + Patents
+# List endpoints (all phases)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# (url, list key, totals that must be positive, fields required on the first item, seeded)
+_LIST_ENDPOINTS = [
+    pytest.param(
+        "/api/materials",
+        "materials",
+        ("total",),
+        (
+            "name",
+            "category",
+            "tensile_strength",
+            "supplier_name",
+            "compliance_certs",
+            "cost_per_kg",
+        ),
+        True,
+        id="materials",
+    ),
+    pytest.param(
+        "/api/patents",
+        "patents",
+        ("total",),
+        ("title", "filing_number", "claims", "inventors"),
+        True,
+        id="patents",
+    ),
+    # Models and features are not seeded records, so they carry no provenance
+    pytest.param(
+        "/api/intelligence/models",
+        "models",
+        ("total",),
+        ("model_id", "model_name", "metrics", "status"),
+        False,
+        id="models",
+    ),
+    pytest.param(
+        "/api/intelligence/feature-store",
+        "features",
+        ("total",),
+        ("name", "dtype", "description"),
+        False,
+        id="feature-store",
+    ),
+]
+
+
+@pytest.mark.parametrize(("url", "list_key", "count_keys", "item_keys", "seeded"), _LIST_ENDPOINTS)
+async def test_list_endpoint(
+    check_list_endpoint: ListEndpointCheck,
+    url: str,
+    list_key: str,
+    count_keys: tuple[str, ...],
+    item_keys: tuple[str, ...],
+    seeded: bool,
+) -> None:
+    """GET on a Phase 3-5 list endpoint should return 200 with a populated list."""
+    await check_list_endpoint(url, list_key, count_keys, item_keys, seeded=seeded)
 
-@pytest.mark.asyncio
-async def test_materials_list(client: AsyncClient) -> None:
-    """GET /api/materials should return 200 with materials."""
-    resp = await client.get("/api/materials")
-    assert resp.status_code == 200
-    body = resp.json()
-    assert "materials" in body
-    assert body["total"] > 0
-    assert len(body["materials"]) > 0
-    mat = body["materials"][0]
-    assert "name" in mat
-    assert "category" in mat
-    assert "tensile_strength" in mat
-    assert "supplier_name" in mat
-    assert "compliance_certs" in mat
-    assert "cost_per_kg" in mat
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Phase 3: Materials + Patents
+# ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
 async def test_materials_filter_by_category(client: AsyncClient) -> None:
     """GET /api/materials?category=structural_steel should filter results."""
     resp = await client.get("/api/materials?category=structural_steel")
@@ -50,7 +137,6 @@ async def test_materials_filter_by_category(client: AsyncClient) -> None:
     assert body["filters_applied"]["category"] == "structural_steel"
 
 
-@pytest.mark.asyncio
 async def test_materials_filter_by_min_strength(client: AsyncClient) -> None:
     """GET /api/materials?min_strength=200 should only return strong materials."""
     resp = await client.get("/api/materials?min_strength=200")
@@ -60,7 +146,6 @@ async def test_materials_filter_by_min_strength(client: AsyncClient) -> None:
         assert mat["tensile_strength"] >= 200
 
 
-@pytest.mark.asyncio
 async def test_smart_materials_endpoint(client: AsyncClient) -> None:
     """GET /api/materials/smart should return only smart materials."""
     resp = await client.get("/api/materials/smart")
@@ -72,32 +157,20 @@ async def test_smart_materials_endpoint(client: AsyncClient) -> None:
     assert body["filters_applied"]["smart_only"] is True
 
 
-@pytest.mark.asyncio
-async def test_material_detail(client: AsyncClient) -> None:
+async def test_material_detail(client: AsyncClient, material_id: str) -> None:
     """GET /api/materials/{id} should return a single material."""
-    data = get_seed_data()
-    mat_id = data["materials"][0]["id"]
-    resp = await client.get(f"/api/materials/{mat_id}")
+    resp = await client.get(f"/api/materials/{material_id}")
     assert resp.status_code == 200
     body = resp.json()
-    assert body["id"] == mat_id
+    assert body["id"] == material_id
     assert "supplier_name" in body
     assert "compliance_certs" in body
 
 
-@pytest.mark.asyncio
-async def test_material_not_found(client: AsyncClient) -> None:
-    """GET /api/materials/{bad_id} should return 404."""
-    resp = await client.get("/api/materials/nonexistent-id")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_material_comparison(client: AsyncClient) -> None:
+async def test_material_comparison(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/materials/compare should compare 2+ materials."""
-    data = get_seed_data()
-    id1 = data["materials"][0]["id"]
-    id2 = data["materials"][1]["id"]
+    id1 = seed_data["materials"][0]["id"]
+    id2 = seed_data["materials"][1]["id"]
     resp = await client.get(f"/api/materials/compare?ids={id1},{id2}")
     assert resp.status_code == 200
     body = resp.json()
@@ -106,20 +179,18 @@ async def test_material_comparison(client: AsyncClient) -> None:
     assert len(body["best_by"]) > 0
 
 
-@pytest.mark.asyncio
-async def test_material_comparison_insufficient_ids(client: AsyncClient) -> None:
+async def test_material_comparison_insufficient_ids(
+    client: AsyncClient, seed_data: dict[str, Any]
+) -> None:
     """GET /api/materials/compare with 1 ID should return 422."""
-    data = get_seed_data()
-    id1 = data["materials"][0]["id"]
+    id1 = seed_data["materials"][0]["id"]
     resp = await client.get(f"/api/materials/compare?ids={id1}")
     assert resp.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_material_audit_trail(client: AsyncClient) -> None:
+async def test_material_audit_trail(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """Material selection and audit trail flow."""
-    data = get_seed_data()
-    mat_id = data["materials"][0]["id"]
+    mat_id = seed_data["materials"][0]["id"]
 
     # Record a selection
     resp = await client.post(
@@ -136,41 +207,21 @@ async def test_material_audit_trail(client: AsyncClient) -> None:
     assert body["reason"] == "Best strength-to-weight ratio"
 
     # Check audit trail
-    resp = await client.get("/api/materials/audit-trail")
+    resp = await client.get(f"/api/materials/audit-trail?material_id={mat_id}")
     assert resp.status_code == 200
     body = resp.json()
-    assert body["total"] > 0
-    assert any(e["material_id"] == mat_id for e in body["entries"])
+    assert body["total"] >= 1
+    assert {e["material_id"] for e in body["entries"]} == {mat_id}
 
 
-@pytest.mark.asyncio
 async def test_lsf_exclusion_in_materials(client: AsyncClient) -> None:
     """Material list should NOT contain LSF or weak materials."""
     resp = await client.get("/api/materials")
     body = resp.json()
-    for mat in body["materials"]:
-        name_lower = mat["name"].lower()
-        assert "lsf" not in name_lower, f"LSF found: {mat['name']}"
-        assert "light steel frame" not in name_lower, f"LSF found: {mat['name']}"
-        assert "light gauge" not in name_lower, f"Weak material found: {mat['name']}"
-
-
-@pytest.mark.asyncio
-async def test_patents_list(client: AsyncClient) -> None:
-    """GET /api/patents should return 200 with patents."""
-    resp = await client.get("/api/patents")
-    assert resp.status_code == 200
-    body = resp.json()
-    assert body["total"] > 0
-    assert len(body["patents"]) > 0
-    patent = body["patents"][0]
-    assert "title" in patent
-    assert "filing_number" in patent
-    assert "claims" in patent
-    assert "inventors" in patent
+    names = "\n".join(mat["name"] for mat in body["materials"])
+    assert not _LSF_RE.search(names), f"LSF or weak material found: {_LSF_RE.findall(names)}"
 
 
-@pytest.mark.asyncio
 async def test_patents_filter_by_status(client: AsyncClient) -> None:
     """GET /api/patents?status=granted should filter by status."""
     resp = await client.get("/api/patents?status=granted")
@@ -180,11 +231,8 @@ async def test_patents_filter_by_status(client: AsyncClient) -> None:
         assert p["status"] == "granted"
 
 
-@pytest.mark.asyncio
-async def test_patent_detail(client: AsyncClient) -> None:
+async def test_patent_detail(client: AsyncClient, patent_id: str) -> None:
     """GET /api/patents/{id} should return patent with claims and experiments."""
-    data = get_seed_data()
-    patent_id = data["patents"][0]["id"]
     resp = await client.get(f"/api/patents/{patent_id}")
     assert resp.status_code == 200
     body = resp.json()
@@ -194,17 +242,13 @@ async def test_patent_detail(client: AsyncClient) -> None:
     assert "novelty_notes" in body
 
 
-@pytest.mark.asyncio
-async def test_patent_add_experiment(client: AsyncClient) -> None:
+async def test_patent_add_experiment(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """POST /api/patents/{id}/experiments should add experiment result."""
-    data = get_seed_data()
-    patent_id = data["patents"][0]["id"]
+    patent_id = seed_data["patents"][0]["id"]
     resp = await client.post(
         f"/api/patents/{patent_id}/experiments",
-        json={
-            "description": "Thermal cycling test at -20C to +60C",
-            "result": "Passed 500 cycles with no degradation",
-        },
+        content=_EXPERIMENT_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 201
     body = resp.json()
@@ -212,24 +256,19 @@ async def test_patent_add_experiment(client: AsyncClient) -> None:
     assert len(body["additional_experiments"]) > 0
 
 
-@pytest.mark.asyncio
-async def test_framework_detail(client: AsyncClient) -> None:
+async def test_framework_detail(client: AsyncClient, framework_id: str) -> None:
     """GET /api/frameworks/{id} should return framework with materials and patents."""
-    data = get_seed_data()
-    fw_id = data["frameworks"][0]["id"]
-    resp = await client.get(f"/api/frameworks/{fw_id}")
+    resp = await client.get(f"/api/frameworks/{framework_id}")
     assert resp.status_code == 200
     body = resp.json()
-    assert body["id"] == fw_id
+    assert body["id"] == framework_id
     assert "materials" in body
     assert "patents" in body
 
 
-@pytest.mark.asyncio
-async def test_framework_bom_variants(client: AsyncClient) -> None:
+async def test_framework_bom_variants(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/frameworks/{id}/bom-variants should return BOM variants."""
-    data = get_seed_data()
-    fw_id = data["frameworks"][0]["id"]
+    fw_id = seed_data["frameworks"][0]["id"]
     resp = await client.get(f"/api/frameworks/{fw_id}/bom-variants")
     assert resp.status_code == 200
     body = resp.json()
@@ -246,11 +285,8 @@ async def test_framework_bom_variants(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_partner_detail(client: AsyncClient) -> None:
+async def test_partner_detail(client: AsyncClient, partner_id: str) -> None:
     """GET /api/partners/{id} should return partner with capacity and compliance."""
-    data = get_seed_data()
-    partner_id = data["partners"][0]["id"]
     resp = await client.get(f"/api/partners/{partner_id}")
     assert resp.status_code == 200
     body = resp.json()
@@ -260,19 +296,12 @@ async def test_partner_detail(client: AsyncClient) -> None:
     assert len(body["compliance_docs"]) > 0
 
 
-@pytest.mark.asyncio
-async def test_partner_not_found(client: AsyncClient) -> None:
-    """GET /api/partners/{bad_id} should return 404."""
-    resp = await client.get("/api/partners/nonexistent-id")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
 async def test_partner_allocation(client: AsyncClient) -> None:
     """POST /api/partners/allocate should allocate order to partners."""
     resp = await client.post(
         "/api/partners/allocate",
-        json={"order_units": 10},
+        content=_ALLOC_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 200
     body = resp.json()
@@ -285,19 +314,18 @@ async def test_partner_allocation(client: AsyncClient) -> None:
         assert alloc["allocated_units"] > 0
 
 
-@pytest.mark.asyncio
 async def test_partner_allocation_with_country(client: AsyncClient) -> None:
     """POST /api/partners/allocate with country preference."""
     resp = await client.post(
         "/api/partners/allocate",
-        json={"order_units": 5, "preferred_country": "Germany"},
+        content=_ALLOC_GERMANY_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 200
     body = resp.json()
     assert body["total_allocated"] > 0
 
 
-@pytest.mark.asyncio
 async def test_partner_optimization(client: AsyncClient) -> None:
     """GET /api/partners/optimize should return optimization result."""
     resp = await client.get("/api/partners/optimize")
@@ -309,22 +337,36 @@ async def test_partner_optimization(client: AsyncClient) -> None:
     assert body["avg_lead_time_days"] > 0
 
 
-@pytest.mark.asyncio
-async def test_partner_optimization_reproducibility(client: AsyncClient) -> None:
-    """GET /api/partners/optimize should return same results with same seed."""
-    resp1 = await client.get("/api/partners/optimize")
-    resp2 = await client.get("/api/partners/optimize")
-    body1 = resp1.json()
-    body2 = resp2.json()
-    assert body1["total_units"] == body2["total_units"]
-    assert body1["optimization_score"] == body2["optimization_score"]
+# blake2b-128 of the key-sorted /api/partners/optimize body for the default seed
+# Pinned optimization digests, keyed by SEED; other seeds only get the same-process check
+_OPTIMIZE_GOLDEN = {42: "7cfc2683d2aa8ee34948d33b8430c114"}
+
+
+async def test_partner_optimization_reproducibility(
+    client: AsyncClient, request: pytest.FixtureRequest
+) -> None:
+    """GET /api/partners/optimize should be stable, and match the pinned result for its seed."""
+    digests = []
+    for _ in range(2):
+        resp = await client.get("/api/partners/optimize")
+        assert resp.status_code == 200
+        canonical = orjson.dumps(resp.json(), option=orjson.OPT_SORT_KEYS)
+        digests.append(hashlib.blake2b(canonical, digest_size=16).hexdigest())
+    digest = digests[0]
+    assert digests[1] == digest, "Optimization output differs between identical calls"
+    if request.config.getoption("--update-golden"):
+        pytest.skip(f"_OPTIMIZE_GOLDEN[{settings.SEED}] = {digest!r}")
+    if settings.SEED not in _OPTIMIZE_GOLDEN:
+        pytest.skip(f"No pinned optimization digest for SEED={settings.SEED}")
+    assert digest == _OPTIMIZE_GOLDEN[settings.SEED], (
+        f"Optimization output changed (digest {digest}); if intended, rerun with "
+        "--update-golden -rs and paste the reported value into _OPTIMIZE_GOLDEN"
+    )
 
 
-@pytest.mark.asyncio
-async def test_partner_quotes(client: AsyncClient) -> None:
+async def test_partner_quotes(client: AsyncClient, seed_data: dict[str, Any]) -> None:
     """GET /api/partners/{id}/quotes should return quotes."""
-    data = get_seed_data()
-    partner_id = data["partners"][0]["id"]
+    partner_id = seed_data["partners"][0]["id"]
     resp = await client.get(f"/api/partners/{partner_id}/quotes")
     assert resp.status_code == 200
     body = resp.json()
@@ -332,7 +374,6 @@ async def test_partner_quotes(client: AsyncClient) -> None:
     assert "quotes" in body
 
 
-@pytest.mark.asyncio
 async def test_partner_compliance(client: AsyncClient) -> None:
     """GET /api/partners/compliance should return EU compliance overview."""
     resp = await client.get("/api/partners/compliance")
@@ -346,7 +387,6 @@ async def test_partner_compliance(client: AsyncClient) -> None:
         assert len(p["docs"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_eu_partner_countries(client: AsyncClient) -> None:
     """Partners should include EU countries."""
     resp = await client.get("/api/partners")
@@ -371,22 +411,6 @@ async def test_eu_partner_countries(client: AsyncClient) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.asyncio
-async def test_model_listing(client: AsyncClient) -> None:
-    """GET /api/intelligence/models should return available ML models."""
-    resp = await client.get("/api/intelligence/models")
-    assert resp.status_code == 200
-    body = resp.json()
-    assert body["total"] > 0
-    assert len(body["models"]) > 0
-    model = body["models"][0]
-    assert "model_id" in model
-    assert "model_name" in model
-    assert "metrics" in model
-    assert "status" in model
-
-
-@pytest.mark.asyncio
 async def test_model_detail(client: AsyncClient) -> None:
     """GET /api/intelligence/models/{id} should return model details."""
     resp = await client.get("/api/intelligence/models/lead-time-forecast-v1")
@@ -397,19 +421,12 @@ async def test_model_detail(client: AsyncClient) -> None:
     assert body["status"] == "ready"
 
 
-@pytest.mark.asyncio
-async def test_model_not_found(client: AsyncClient) -> None:
-    """GET /api/intelligence/models/{bad_id} should return 404."""
-    resp = await client.get("/api/intelligence/models/nonexistent-model")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
 async def test_forecast_endpoint(client: AsyncClient) -> None:
     """POST /api/intelligence/forecast should return predictions."""
     resp = await client.post(
         "/api/intelligence/forecast",
-        json={"horizon_periods": 6, "confidence_level": 0.95},
+        content=_FORECAST_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 200
     body = resp.json()
@@ -426,12 +443,12 @@ async def test_forecast_endpoint(client: AsyncClient) -> None:
         assert point["lower_bound"] <= point["value"] <= point["upper_bound"]
 
 
-@pytest.mark.asyncio
 async def test_anomaly_detection(client: AsyncClient) -> None:
     """POST /api/intelligence/anomaly-detect should return anomaly results."""
     resp = await client.post(
         "/api/intelligence/anomaly-detect",
-        json={"threshold": 2.0},
+        content=_ANOMALY_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 200
     body = resp.json()
@@ -446,29 +463,12 @@ async def test_anomaly_detection(client: AsyncClient) -> None:
         assert "is_anomaly" in point
 
 
-@pytest.mark.asyncio
-async def test_feature_store(client: AsyncClient) -> None:
-    """GET /api/intelligence/feature-store should return features."""
-    resp = await client.get("/api/intelligence/feature-store")
-    assert resp.status_code == 200
-    body = resp.json()
-    assert body["total"] > 0
-    feature = body["features"][0]
-    assert "name" in feature
-    assert "dtype" in feature
-    assert "description" in feature
-
-
-@pytest.mark.asyncio
 async def test_training_job_submission(client: AsyncClient) -> None:
     """POST /api/intelligence/train should submit and return a training job."""
     resp = await client.post(
         "/api/intelligence/train",
-        json={
-            "model_name": "test-model",
-            "features": ["scheduled_duration_days", "priority"],
-            "target": "lead_time_days",
-        },
+        content=_TRAIN_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 201
     body = resp.json()
@@ -484,8 +484,23 @@ async def test_training_job_submission(client: AsyncClient) -> None:
     assert body2["job_id"] == job_id
 
 
-@pytest.mark.asyncio
-async def test_training_job_not_found(client: AsyncClient) -> None:
-    """GET /api/intelligence/train/{bad_id} should return 404."""
-    resp = await client.get("/api/intelligence/train/nonexistent-job")
+# ═══════════════════════════════════════════════════════════════════════════════
+# Not found
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_MISSING_ID = "nonexistent-id"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        pytest.param(f"/api/materials/{_MISSING_ID}", id="material"),
+        pytest.param(f"/api/partners/{_MISSING_ID}", id="partner"),
+        pytest.param(f"/api/intelligence/models/{_MISSING_ID}", id="model"),
+        pytest.param(f"/api/intelligence/train/{_MISSING_ID}", id="training_job"),
+    ],
+)
+async def test_not_found(client: AsyncClient, url: str) -> None:
+    """GET on a detail endpoint with an unknown id should return 404."""
+    resp = await client.get(url)
     assert resp.status_code == 404
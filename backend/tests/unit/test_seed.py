@@ -2,98 +2,97 @@
 
 from __future__ import annotations
 
-from app.seed.generator import SeedGenerator
-
+import hashlib
+import re
+from typing import Any
 
-def test_seed_determinism() -> None:
-    """Two generators with the same seed must produce identical output."""
-    gen1 = SeedGenerator(seed=42)
-    gen2 = SeedGenerator(seed=42)
+import orjson
+import pytest
 
-    data1 = gen1.generate_all()
-    data2 = gen2.generate_all()
+from app.seed.generator import SeedGenerator
 
-    # Compare every key
-    assert set(data1.keys()) == set(data2.keys())
-    for key in data1:
-        assert data1[key] == data2[key], f"Mismatch in entity type: {key}"
+_LSF_RE = re.compile(r"lsf|light steel frame|light gauge", re.IGNORECASE)
+
+
+def _digest(data: Any) -> bytes:
+    """Hash the canonical (key-sorted) JSON encoding of a seed dataset."""
+    return hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).digest()
+
+
+@pytest.fixture(scope="class")
+def data() -> dict[str, Any]:
+    """One ``seed=42`` dataset shared by every test in ``TestSeed42``."""
+    return SeedGenerator(seed=42).generate_all()
+
+
+class TestSeed42:
+    """Checks against the default ``seed=42`` dataset, generated once per class."""
+
+    def test_seed_determinism(self, data: dict[str, Any]) -> None:
+        """Two generators with the same seed must produce identical output."""
+        again = SeedGenerator(seed=42).generate_all()
+
+        assert set(data) == set(again)
+        mismatched = [key for key in data if _digest(data[key]) != _digest(again[key])]
+        assert not mismatched, f"Mismatch in entity types: {mismatched}"
+
+    def test_all_records_have_provenance(self, data: dict[str, Any]) -> None:
+        """Every generated record must carry source='synthetic_seeded'."""
+        # Scene is a dict, not a list of records
+        lists = {key: records for key, records in data.items() if key != "factory_scene"}
+        not_lists = [key for key, records in lists.items() if not isinstance(records, list)]
+        assert not not_lists, f"Entity types should be lists: {not_lists}"
+
+        offenders = [
+            (key, rec.get("id", "unknown"))
+            for key, records in lists.items()
+            for rec in records
+            if rec.get("source") != "synthetic_seeded"
+        ]
+        assert not offenders, f"Records missing source='synthetic_seeded': {offenders}"
+
+    def test_no_lsf_materials(self, data: dict[str, Any]) -> None:
+        """Seed data must NOT contain LSF or weak materials."""
+        names = "\n".join(mat["name"] for mat in data["materials"])
+        assert not _LSF_RE.search(names), f"LSF or weak material found: {_LSF_RE.findall(names)}"
+
+    def test_entity_counts(self, data: dict[str, Any]) -> None:
+        """Verify expected entity counts from default generation."""
+        assert len(data["suppliers"]) == 8
+        assert len(data["materials"]) == 14
+        assert len(data["house_configs"]) == 6
+        assert len(data["frameworks"]) == 4
+        assert len(data["patents"]) == 6
+        assert len(data["leads"]) == 15
+        assert len(data["production_lines"]) == 4
+        assert len(data["partners"]) == 8
+        assert len(data["insight_reports"]) == 8
+        assert len(data["partner_quotes"]) > 0
+        assert len(data["time_series_data"]) > 0
+        assert len(data["qa_outlier_records"]) > 0
+        # Dependent entities should have at least some records
+        assert len(data["opportunities"]) > 0
+        assert len(data["boms"]) > 0
+        assert len(data["work_orders"]) > 0
+
+    def test_factory_scene_structure(self, data: dict[str, Any]) -> None:
+        """Factory scene should have objects and camera."""
+        scene = data["factory_scene"]
+        assert "objects" in scene
+        assert "camera" in scene
+        assert len(scene["objects"]) > 0
+        for obj in scene["objects"]:
+            assert "id" in obj
+            assert "name" in obj
+            assert "type" in obj
+            assert "position" in obj
+            assert "scale" in obj
 
 
 def test_different_seed_produces_different_data() -> None:
     """Generators with different seeds must produce different data."""
-    gen1 = SeedGenerator(seed=42)
-    gen2 = SeedGenerator(seed=99)
-
-    data1 = gen1.generate_all()
-    data2 = gen2.generate_all()
+    leads1 = SeedGenerator(seed=42).generate_leads()
+    leads2 = SeedGenerator(seed=99).generate_leads()
 
     # Leads should differ (names are randomly generated)
-    assert data1["leads"][0]["name"] != data2["leads"][0]["name"]
-
-
-def test_all_records_have_provenance() -> None:
-    """Every generated record must carry source='synthetic_seeded'."""
-    gen = SeedGenerator(seed=42)
-    data = gen.generate_all()
-
-    for key, records in data.items():
-        if key == "factory_scene":
-            # Scene is a dict, not a list of records
-            continue
-        assert isinstance(records, list), f"{key} should be a list"
-        for rec in records:
-            assert rec.get("source") == "synthetic_seeded", (
-                f"Record in {key} missing source='synthetic_seeded': {rec.get('id', 'unknown')}"
-            )
-
-
-def test_no_lsf_materials() -> None:
-    """Seed data must NOT contain LSF or weak materials."""
-    gen = SeedGenerator(seed=42)
-    data = gen.generate_all()
-
-    for mat in data["materials"]:
-        name_lower = mat["name"].lower()
-        assert "lsf" not in name_lower, f"LSF material found: {mat['name']}"
-        assert "light steel frame" not in name_lower, f"LSF material found: {mat['name']}"
-        assert "light gauge" not in name_lower, f"Weak material found: {mat['name']}"
-
-
-def test_entity_counts() -> None:
-    """Verify expected entity counts from default generation."""
-    gen = SeedGenerator(seed=42)
-    data = gen.generate_all()
-
-    assert len(data["suppliers"]) == 8
-    assert len(data["materials"]) == 14
-    assert len(data["house_configs"]) == 6
-    assert len(data["frameworks"]) == 4
-    assert len(data["patents"]) == 6
-    assert len(data["leads"]) == 15
-    assert len(data["production_lines"]) == 4
-    assert len(data["partners"]) == 8
-    assert len(data["insight_reports"]) == 8
-    assert len(data["partner_quotes"]) > 0
-    assert len(data["time_series_data"]) > 0
-    assert len(data["qa_outlier_records"]) > 0
-    # Dependent entities should have at least some records
-    assert len(data["opportunities"]) > 0
-    assert len(data["boms"]) > 0
-    assert len(data["work_orders"]) > 0
-
-
-def test_factory_scene_structure() -> None:
-    """Factory scene should have objects and camera."""
-    gen = SeedGenerator(seed=42)
-    data = gen.generate_all()
-
-    scene = data["factory_scene"]
-    assert "objects" in scene
-    assert "camera" in scene
-    assert len(scene["objects"]) > 0
-    for obj in scene["objects"]:
-        assert "id" in obj
-        assert "name" in obj
-        assert "type" in obj
-        assert "position" in obj
-        assert "scale" in obj
+    assert leads1[0]["name"] != leads2[0]["name"]